@@ -0,0 +1,501 @@
+#!/usr/bin/env node
+/**
+ * Headless benchmark for the Ultrahuman Lovelace cards.
+ *
+ * Loads ultrahuman-ring-card.js into a sandbox with a minimal DOM shim and a
+ * synthetic `hass` object, mounts N cards of each type and pushes a stream of
+ * state changes at them, half of them for unrelated entities and half for the
+ * Ultrahuman sensors. Reports time per update, DOM node churn and the number
+ * of history (`callWS`) requests made by the sparklines.
+ *
+ * Usage: node benchmarks/card-benchmark.js [--cards N] [--updates N]
+ *          [--relevant RATIO] [--card TYPE] [--json]
+ */
+
+"use strict";
+
+const fs = require("fs");
+const path = require("path");
+const vm = require("vm");
+const { performance } = require("perf_hooks");
+
+const CARD_JS = path.join(
+  __dirname, "..", "custom_components", "ultrahuman", "www", "ultrahuman-ring-card.js"
+);
+
+const CARD_TYPES = [
+  "ultrahuman-ring-card",
+  "ultrahuman-ring-overview-card",
+  "ultrahuman-ring-sleep-card",
+  "ultrahuman-ring-movement-card",
+  "ultrahuman-ring-recovery-card",
+  "ultrahuman-ring-heart-card",
+  "ultrahuman-ring-glucose-card",
+];
+
+const METRICS = {
+  sleep_score: [40, 95], total_sleep: [300, 540], sleep_efficiency: [70, 98],
+  deep_sleep: [40, 120], rem_sleep: [60, 140], light_sleep: [150, 300],
+  restorative_sleep: [20, 50], spo2: [92, 100], heart_rate: [50, 110],
+  resting_heart_rate: [45, 70], hrv: [20, 90], skin_temperature: [33, 37],
+  steps: [0, 15000], metabolic_score: [40, 95], glucose_variability: [5, 30],
+  average_glucose: [80, 130], hba1c: [4.5, 6.5], time_in_target: [60, 100],
+  recovery_index: [40, 95], movement_index: [40, 95], vo2_max: [30, 55],
+};
+
+const UNRELATED_ENTITIES = 200;
+
+/* ══════════════════════ ARGUMENTS ══════════════════════ */
+
+function parseArgs(argv) {
+  const opts = { cards: 10, updates: 1000, relevant: 0.5, card: null, json: false };
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i];
+    if (arg === "--json") opts.json = true;
+    else if (arg === "--cards") opts.cards = parseInt(argv[++i], 10);
+    else if (arg === "--updates") opts.updates = parseInt(argv[++i], 10);
+    else if (arg === "--relevant") opts.relevant = parseFloat(argv[++i]);
+    else if (arg === "--card") opts.card = argv[++i];
+    else throw new Error(`Unknown argument: ${arg}`);
+  }
+  if (opts.card && !CARD_TYPES.includes(opts.card)) {
+    throw new Error(`Unknown card type: ${opts.card} (expected one of ${CARD_TYPES.join(", ")})`);
+  }
+  return opts;
+}
+
+/* ══════════════════════ DETERMINISTIC RANDOM ══════════════════════ */
+
+function makeRandom(seed) {
+  let state = seed >>> 0;
+  return () => {
+    state = (state * 1664525 + 1013904223) >>> 0;
+    return state / 4294967296;
+  };
+}
+
+/* ══════════════════════ DOM SHIM ══════════════════════ */
+
+const churn = { created: 0, removed: 0 };
+
+const VOID_TAGS = new Set(["area", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"]);
+const TOKEN_RE = /<!--[\s\S]*?-->|<\/([a-zA-Z][\w:-]*)\s*>|<([a-zA-Z][\w:-]*)((?:\s+[^\s=>\/]+(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s>]+))?)*)\s*(\/?)>|[^<]+/g;
+const ATTR_RE = /([^\s=>\/]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+)))?/g;
+
+class ShimNode {
+  constructor() {
+    this.parentNode = null;
+    this.childNodes = [];
+    churn.created++;
+  }
+
+  get firstChild() { return this.childNodes[0] || null; }
+
+  appendChild(node) {
+    if (node.parentNode) node.parentNode.removeChild(node);
+    node.parentNode = this;
+    this.childNodes.push(node);
+    return node;
+  }
+
+  removeChild(node) {
+    const idx = this.childNodes.indexOf(node);
+    if (idx !== -1) this.childNodes.splice(idx, 1);
+    node.parentNode = null;
+    return node;
+  }
+
+  get textContent() {
+    return this.childNodes.map(n => n.textContent).join("");
+  }
+
+  set textContent(value) {
+    this._dropChildren();
+    if (value) this.appendChild(new ShimText(String(value)));
+  }
+
+  _dropChildren() {
+    for (const child of this.childNodes) {
+      churn.removed += countNodes(child);
+      child.parentNode = null;
+    }
+    this.childNodes = [];
+  }
+
+  getElementById(id) {
+    for (const child of this.childNodes) {
+      if (child.id === id) return child;
+      const found = child.getElementById ? child.getElementById(id) : null;
+      if (found) return found;
+    }
+    return null;
+  }
+}
+
+class ShimText extends ShimNode {
+  constructor(data) {
+    super();
+    this.data = data;
+  }
+
+  get textContent() { return this.data; }
+  set textContent(value) { this.data = String(value); }
+}
+
+class ShimClassList {
+  constructor() { this._set = new Set(); }
+  add(...names) { names.forEach(n => this._set.add(n)); }
+  remove(...names) { names.forEach(n => this._set.delete(n)); }
+  contains(name) { return this._set.has(name); }
+  toggle(name) { return this._set.has(name) ? (this._set.delete(name), false) : (this._set.add(name), true); }
+}
+
+class ShimElement extends ShimNode {
+  constructor(tagName = "div") {
+    super();
+    this.tagName = tagName.toUpperCase();
+    this.attributes = {};
+    this.classList = new ShimClassList();
+    this.style = {};
+    this.shadowRoot = null;
+    this._listeners = {};
+  }
+
+  get id() { return this.attributes.id || ""; }
+  set id(value) { this.attributes.id = String(value); }
+  get className() { return this.attributes.class || ""; }
+  set className(value) { this.attributes.class = String(value); }
+
+  setAttribute(name, value) { this.attributes[name] = String(value); }
+  getAttribute(name) { return name in this.attributes ? this.attributes[name] : null; }
+
+  set innerHTML(html) {
+    this._dropChildren();
+    parseHTML(String(html), this);
+  }
+
+  get innerHTML() {
+    return this.childNodes.map(serialize).join("");
+  }
+
+  attachShadow() {
+    this.shadowRoot = new ShimShadowRoot(this);
+    return this.shadowRoot;
+  }
+
+  addEventListener(type, fn) {
+    (this._listeners[type] = this._listeners[type] || []).push(fn);
+  }
+
+  removeEventListener(type, fn) {
+    this._listeners[type] = (this._listeners[type] || []).filter(l => l !== fn);
+  }
+
+  dispatchEvent(event) {
+    (this._listeners[event.type] || []).forEach(fn => fn(event));
+    return true;
+  }
+}
+
+class ShimShadowRoot extends ShimNode {
+  constructor(host) {
+    super();
+    this.host = host;
+  }
+}
+
+function countNodes(node) {
+  let count = 1;
+  for (const child of node.childNodes) count += countNodes(child);
+  if (node.shadowRoot) count += countNodes(node.shadowRoot);
+  return count;
+}
+
+function parseHTML(html, parent) {
+  const stack = [parent];
+  TOKEN_RE.lastIndex = 0;
+  let match;
+  while ((match = TOKEN_RE.exec(html)) !== null) {
+    const [token, closeTag, openTag, attrs, selfClosing] = match;
+    const top = stack[stack.length - 1];
+    if (token.startsWith("<!--")) continue;
+    if (closeTag) {
+      const name = closeTag.toUpperCase();
+      for (let i = stack.length - 1; i > 0; i--) {
+        if (stack[i].tagName === name) {
+          stack.length = i;
+          break;
+        }
+      }
+    } else if (openTag) {
+      const el = new ShimElement(openTag);
+      ATTR_RE.lastIndex = 0;
+      let attr;
+      while ((attr = ATTR_RE.exec(attrs || "")) !== null) {
+        el.attributes[attr[1]] = attr[2] ?? attr[3] ?? attr[4] ?? "";
+      }
+      top.appendChild(el);
+      if (!selfClosing && !VOID_TAGS.has(openTag.toLowerCase())) stack.push(el);
+    } else {
+      top.appendChild(new ShimText(token));
+    }
+  }
+}
+
+function serialize(node) {
+  if (node instanceof ShimText) return node.data;
+  const tag = node.tagName.toLowerCase();
+  const attrs = Object.entries(node.attributes).map(([k, v]) => ` ${k}="${v}"`).join("");
+  return `<${tag}${attrs}>${node.childNodes.map(serialize).join("")}</${tag}>`;
+}
+
+function createSandbox(hooks) {
+  const registry = new Map();
+
+  // Custom elements extend this; the tag name is filled in by createElement.
+  class HTMLElement extends ShimElement {
+    constructor() { super("custom-element"); }
+  }
+
+  const document = {
+    createElement(tag) {
+      const Cls = registry.get(tag);
+      if (Cls) {
+        const el = new Cls();
+        el.tagName = tag.toUpperCase();
+        return el;
+      }
+      return new ShimElement(tag);
+    },
+  };
+
+  const customElements = {
+    define(name, cls) { registry.set(name, cls); },
+    get(name) { return registry.get(name); },
+  };
+
+  class CustomEvent {
+    constructor(type, init = {}) {
+      this.type = type;
+      this.detail = init.detail;
+    }
+  }
+
+  const sandbox = {
+    HTMLElement,
+    CustomEvent,
+    document,
+    customElements,
+    console: { ...console, info() {} },
+    setTimeout: hooks.setTimeout,
+    clearTimeout: hooks.clearTimeout,
+    Promise,
+    Date,
+    Math,
+  };
+  sandbox.window = sandbox;
+  return vm.createContext(sandbox);
+}
+
+/* ══════════════════════ SYNTHETIC HASS ══════════════════════ */
+
+function entityState(value) {
+  const now = new Date().toISOString();
+  return { state: String(value), attributes: {}, last_changed: now, last_updated: now };
+}
+
+function makeHass(prefix, random, stats) {
+  const states = {};
+  for (const [key, [lo, hi]] of Object.entries(METRICS)) {
+    states[`${prefix}_${key}`] = entityState(Math.round(lo + random() * (hi - lo)));
+  }
+  for (let i = 0; i < UNRELATED_ENTITIES; i++) {
+    states[`sensor.unrelated_${i}`] = entityState(Math.round(random() * 100));
+  }
+
+  return {
+    states,
+    async callWS(msg) {
+      stats.historyCalls++;
+      const result = {};
+      const end = Date.now();
+      for (const entityId of msg.entity_ids) {
+        const range = METRICS[entityId.slice(prefix.length + 1)] || [0, 100];
+        result[entityId] = Array.from({ length: 24 }, (_, i) => ({
+          s: String(Math.round(range[0] + random() * (range[1] - range[0]))),
+          lu: (end - (24 - i) * 3600 * 1000) / 1000,
+        }));
+      }
+      return result;
+    },
+    async callService() {},
+  };
+}
+
+// Home Assistant replaces the hass object and the changed entity's state
+// object on every state change, and keeps all other state objects as-is.
+function nextHass(hass, entityId, value) {
+  return { ...hass, states: { ...hass.states, [entityId]: entityState(value) } };
+}
+
+/* ══════════════════════ BENCHMARK ══════════════════════ */
+
+// Timers scheduled by the cards run on the next flush regardless of their
+// delay, so deferred work is measured as part of the update that queued it.
+function makeTimers() {
+  const pending = new Map();
+  let nextId = 1;
+  return {
+    setTimeout(fn, _delay, ...args) {
+      const id = nextId++;
+      pending.set(id, () => fn(...args));
+      return id;
+    },
+    clearTimeout(id) {
+      pending.delete(id);
+    },
+    run() {
+      const due = [...pending.values()];
+      pending.clear();
+      due.forEach(fn => fn());
+      return due.length;
+    },
+  };
+}
+
+async function flush(timers) {
+  do {
+    await new Promise(resolve => setImmediate(resolve));
+  } while (timers.run() > 0);
+}
+
+async function runCardType(cardType, opts) {
+  const prefix = "sensor.ultrahuman_ring_bench";
+  const random = makeRandom(0x5eed);
+  const stats = { historyCalls: 0 };
+  const timers = makeTimers();
+  const ctx = createSandbox(timers);
+  vm.runInContext(fs.readFileSync(CARD_JS, "utf8"), ctx, { filename: CARD_JS });
+
+  let hass = makeHass(prefix, random, stats);
+  const metricKeys = Object.keys(METRICS);
+
+  churn.created = 0;
+  churn.removed = 0;
+  const mountStart = performance.now();
+  const cards = [];
+  for (let i = 0; i < opts.cards; i++) {
+    const card = ctx.document.createElement(cardType);
+    card.setConfig({ type: `custom:${cardType}`, entity_prefix: prefix });
+    card.hass = hass;
+    cards.push(card);
+  }
+  await flush(timers);
+  const mount = {
+    ms: performance.now() - mountStart,
+    nodesCreated: churn.created,
+    historyCalls: stats.historyCalls,
+  };
+
+  const phases = {};
+  for (const kind of ["unrelated", "relevant"]) {
+    phases[kind] = { updates: 0, syncMs: 0, totalMs: 0, nodesCreated: 0, nodesRemoved: 0, historyCalls: 0 };
+  }
+
+  for (let u = 0; u < opts.updates; u++) {
+    const relevant = random() < opts.relevant;
+    const phase = phases[relevant ? "relevant" : "unrelated"];
+    let entityId;
+    let value;
+    if (relevant) {
+      const key = metricKeys[Math.floor(random() * metricKeys.length)];
+      const [lo, hi] = METRICS[key];
+      entityId = `${prefix}_${key}`;
+      value = Math.round(lo + random() * (hi - lo));
+    } else {
+      entityId = `sensor.unrelated_${Math.floor(random() * UNRELATED_ENTITIES)}`;
+      value = Math.round(random() * 100);
+    }
+    hass = nextHass(hass, entityId, value);
+
+    const created = churn.created;
+    const removed = churn.removed;
+    const historyCalls = stats.historyCalls;
+    const start = performance.now();
+    for (const card of cards) card.hass = hass;
+    const syncEnd = performance.now();
+    await flush(timers);
+    const end = performance.now();
+
+    phase.updates++;
+    phase.syncMs += syncEnd - start;
+    phase.totalMs += end - start;
+    phase.nodesCreated += churn.created - created;
+    phase.nodesRemoved += churn.removed - removed;
+    phase.historyCalls += stats.historyCalls - historyCalls;
+  }
+
+  // Expire the sparkline history cache to measure a cold refetch round.
+  vm.runInContext("UH_HISTORY_CACHE.clear()", ctx);
+  const coldCalls = stats.historyCalls;
+  for (const card of cards) card.hass = hass;
+  await flush(timers);
+
+  return {
+    card: cardType,
+    cards: opts.cards,
+    mount,
+    phases,
+    coldRefetchHistoryCalls: stats.historyCalls - coldCalls,
+  };
+}
+
+function summarize(result) {
+  const rows = [];
+  for (const [kind, phase] of Object.entries(result.phases)) {
+    const n = phase.updates || 1;
+    rows.push({
+      card: result.card,
+      kind,
+      updates: phase.updates,
+      "sync ms/update": (phase.syncMs / n).toFixed(3),
+      "total ms/update": (phase.totalMs / n).toFixed(3),
+      "nodes +/update": Math.round(phase.nodesCreated / n),
+      "nodes -/update": Math.round(phase.nodesRemoved / n),
+      "history calls": phase.historyCalls,
+    });
+  }
+  return rows;
+}
+
+async function main() {
+  const opts = parseArgs(process.argv.slice(2));
+  const types = opts.card ? [opts.card] : CARD_TYPES;
+  const results = [];
+  for (const type of types) {
+    results.push(await runCardType(type, opts));
+  }
+
+  if (opts.json) {
+    console.log(JSON.stringify({ options: opts, results }, null, 2));
+    return;
+  }
+
+  console.log(
+    `${opts.cards} card(s) per type, ${opts.updates} state changes ` +
+    `(${Math.round(opts.relevant * 100)}% relevant)\n`
+  );
+  console.table(results.map(r => ({
+    card: r.card,
+    "mount ms": r.mount.ms.toFixed(2),
+    "mount nodes": r.mount.nodesCreated,
+    "mount history calls": r.mount.historyCalls,
+    "cold refetch history calls": r.coldRefetchHistoryCalls,
+  })));
+  console.table(results.flatMap(summarize));
+}
+
+main().catch(err => {
+  console.error(err);
+  process.exit(1);
+});
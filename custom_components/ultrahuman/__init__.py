@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from datetime import timedelta
 from pathlib import Path
 
 from homeassistant.components.http import StaticPathConfig
@@ -12,8 +13,15 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import UltrahumanApiClient
-from .const import CONF_API_KEY, CONF_EMAIL, DOMAIN
+from .const import (
+    CONF_API_KEY,
+    CONF_EMAIL,
+    CONF_MAX_STALENESS,
+    DEFAULT_MAX_STALENESS,
+    DOMAIN,
+)
 from .coordinator import UltrahumanDataUpdateCoordinator
+from .history import UltrahumanHistoryStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -70,7 +78,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         email=entry.data[CONF_EMAIL],
     )
 
-    coordinator = UltrahumanDataUpdateCoordinator(hass, client)
+    coordinator = UltrahumanDataUpdateCoordinator(
+        hass,
+        client,
+        max_staleness=timedelta(
+            hours=entry.options.get(CONF_MAX_STALENESS, DEFAULT_MAX_STALENESS)
+        ),
+        history=_history_store(hass, entry),
+    )
 
     # Perform an initial data fetch so sensors have data
     await coordinator.async_config_entry_first_refresh()
@@ -80,9 +95,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the local metric history when a config entry is removed."""
+    await hass.async_add_executor_job(_history_store(hass, entry).remove)
+
+
+def _history_store(hass: HomeAssistant, entry: ConfigEntry) -> UltrahumanHistoryStore:
+    """Return the local metric history store for a config entry."""
+    return UltrahumanHistoryStore(Path(hass.config.path(DOMAIN, entry.entry_id)))
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options to the running coordinator.
+
+    The entry is not reloaded, so the last good snapshot survives an option
+    change made while the API is failing.
+    """
+    coordinator: UltrahumanDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator.max_staleness = timedelta(
+        hours=entry.options.get(CONF_MAX_STALENESS, DEFAULT_MAX_STALENESS)
+    )
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
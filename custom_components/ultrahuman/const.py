@@ -7,3 +7,12 @@ CONF_EMAIL = "email"
 
 API_BASE_URL = "https://partner.ultrahuman.com/api/v1"
 API_METRICS_ENDPOINT = f"{API_BASE_URL}/metrics"
+
+CONF_MAX_STALENESS = "max_staleness"
+
+# Hours the last good snapshot may be served while the API is failing
+DEFAULT_MAX_STALENESS = 12
+
+# Circuit breaker probe backoff while the API is failing
+PROBE_BACKOFF_INITIAL = 300
+PROBE_BACKOFF_MAX = 3600
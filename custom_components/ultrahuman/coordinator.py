@@ -3,50 +3,110 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
-from typing import Any
+from collections.abc import Callable, Mapping
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import UltrahumanApiClient, UltrahumanApiError, UltrahumanAuthError
-from .const import DOMAIN
+from .const import (
+    DEFAULT_MAX_STALENESS,
+    DOMAIN,
+    PROBE_BACKOFF_INITIAL,
+    PROBE_BACKOFF_MAX,
+)
+
+if TYPE_CHECKING:
+    from .history import UltrahumanHistoryStore
 
 _LOGGER = logging.getLogger(__name__)
 
+UPDATE_INTERVAL = timedelta(hours=1)
+
+# Scheduled refreshes can fire slightly before the probe time they were
+# scheduled for, so allow some slack when deciding whether to probe
+PROBE_SLACK = timedelta(seconds=5)
+
+# Only report the served data as stale once it has missed a full poll plus
+# an hour of retries, so that a brief upstream failure changes no attributes
+STALE_AFTER = 2 * UPDATE_INTERVAL
+
 
 class UltrahumanDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator that fetches data from the Ultrahuman API.
 
     Automatically polls every hour and also supports manual refresh via
     the homeassistant.update_entity service or the UI refresh button.
+
+    When the API fails, a circuit breaker opens and the last good snapshot
+    keeps being served for up to ``max_staleness``. While the circuit is
+    open the API is only probed on an exponential backoff schedule, and
+    refreshes requested in between are answered from the snapshot.
+
+    Every successful fetch is also appended to the local history store,
+    using the value functions registered by the sensor platform.
     """
 
     def __init__(
         self,
         hass: HomeAssistant,
         client: UltrahumanApiClient,
+        max_staleness: timedelta = timedelta(hours=DEFAULT_MAX_STALENESS),
+        history: UltrahumanHistoryStore | None = None,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(hours=1),
+            update_interval=UPDATE_INTERVAL,
         )
         self.client = client
+        self.max_staleness = max_staleness
+        self.history = history
+        self._history_fns: Mapping[str, Callable[[dict[str, Any]], Any]] = {}
+        self._last_good_date: date | None = None
+        self.last_success_time: datetime | None = None
+        self._last_good: dict[str, Any] | None = None
+        self._failures = 0
+        self._next_probe: datetime | None = None
+
+    @property
+    def circuit_open(self) -> bool:
+        """Return True while the API is failing and the snapshot is served."""
+        return self._failures > 0
+
+    @property
+    def is_stale(self) -> bool:
+        """Return True once the served snapshot is older than ``STALE_AFTER``."""
+        return (
+            self.circuit_open
+            and self.last_success_time is not None
+            and dt_util.utcnow() - self.last_success_time > STALE_AFTER
+        )
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from the Ultrahuman API."""
+        now = dt_util.utcnow()
+        if self._next_probe is not None and now + PROBE_SLACK < self._next_probe:
+            # Keep the scheduled probe where it was instead of pushing it a
+            # full backoff past this refresh
+            self.update_interval = self._next_probe - now
+            return self._serve_last_good("waiting for next probe")
+
+        query_date = date.today()
         try:
-            response = await self.client.async_get_metrics()
+            response = await self.client.async_get_metrics(query_date)
         except UltrahumanAuthError as err:
             raise UpdateFailed(f"Authentication failed: {err}") from err
         except UltrahumanApiError as err:
-            raise UpdateFailed(f"Error fetching data: {err}") from err
+            return self._handle_failure(f"Error fetching data: {err}")
 
         if response.get("error") is not None:
-            raise UpdateFailed(f"API returned error: {response['error']}")
+            return self._handle_failure(f"API returned error: {response['error']}")
 
         data = response.get("data", {})
         metric_data = data.get("metric_data", [])
@@ -59,4 +119,82 @@ class UltrahumanDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if metric_type:
                 parsed[metric_type] = metric_obj
 
+        if self.circuit_open:
+            _LOGGER.info(
+                "Ultrahuman API recovered after %s failed attempt(s)", self._failures
+            )
+        self._failures = 0
+        self._next_probe = None
+        self.update_interval = UPDATE_INTERVAL
+        self._last_good = parsed
+        self._last_good_date = query_date
+        self.last_success_time = dt_util.utcnow()
+
+        await self._async_record_history()
+
         return parsed
+
+    async def async_set_history_fields(
+        self, value_fns: Mapping[str, Callable[[dict[str, Any]], Any]]
+    ) -> None:
+        """Set the metrics recorded in history and record the current data."""
+        self._history_fns = value_fns
+        await self._async_record_history()
+
+    async def _async_record_history(self) -> None:
+        """Append the last good data to the history store, best-effort."""
+        if (
+            self.history is None
+            or not self._history_fns
+            or self._last_good is None
+            or self._last_good_date is None
+        ):
+            return
+        try:
+            await self.hass.async_add_executor_job(
+                self.history.append,
+                self._last_good_date,
+                self._last_good,
+                self._history_fns,
+            )
+        except Exception:
+            _LOGGER.exception("Could not record Ultrahuman history")
+
+    async def async_get_history(
+        self, key: str, start: date | None = None, end: date | None = None
+    ) -> list[tuple[date, float]]:
+        """Return the locally recorded daily values for a metric."""
+        if self.history is None:
+            return []
+        return await self.hass.async_add_executor_job(
+            self.history.read, key, start, end
+        )
+
+    def _handle_failure(self, reason: str) -> dict[str, Any]:
+        """Open the circuit, schedule the next probe and serve the snapshot."""
+        self._failures += 1
+        backoff = timedelta(
+            seconds=min(
+                PROBE_BACKOFF_INITIAL * 2 ** (self._failures - 1), PROBE_BACKOFF_MAX
+            )
+        )
+        self._next_probe = dt_util.utcnow() + backoff
+        self.update_interval = backoff
+        _LOGGER.debug(
+            "%s; next probe in %s (attempt %s)", reason, backoff, self._failures
+        )
+        return self._serve_last_good(reason)
+
+    def _serve_last_good(self, reason: str) -> dict[str, Any]:
+        """Return the last good snapshot, or fail if it is missing or too old."""
+        if self._last_good is None or self.last_success_time is None:
+            raise UpdateFailed(reason)
+
+        age = dt_util.utcnow() - self.last_success_time
+        if age > self.max_staleness:
+            raise UpdateFailed(
+                f"{reason}; last good data is {age} old, "
+                f"exceeding the {self.max_staleness} staleness limit"
+            )
+
+        return self._last_good
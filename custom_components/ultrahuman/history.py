@@ -0,0 +1,167 @@
+"""Local columnar metric history for Ultrahuman."""
+
+from __future__ import annotations
+
+import logging
+import math
+import mmap
+import os
+import shutil
+import struct
+import sys
+from array import array
+from collections.abc import Callable, Mapping
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Each column file is a fixed header followed by one little-endian float64
+# per day, starting at the day stored in the header. Missing days are NaN.
+_HEADER = struct.Struct("<8sq")
+_MAGIC = b"UHCOL\x00\x00\x01"
+_ITEM = 8
+_MISSING = float("nan")
+_SWAP = sys.byteorder != "little"
+
+
+class UltrahumanHistoryStore:
+    """Store one value per metric per day, one memory-mapped column per metric.
+
+    Appends are plain file writes; reads map the column and slice the days
+    requested, so history queries never touch the API or the recorder.
+    All methods do blocking I/O and must run in the executor.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the store rooted at the given directory."""
+        self._path = path
+
+    def append(
+        self,
+        day: date,
+        data: dict[str, Any],
+        value_fns: Mapping[str, Callable[[dict[str, Any]], Any]],
+    ) -> None:
+        """Record the current value of every metric for the given day.
+
+        Args:
+            day: The day the data belongs to.
+            data: The parsed coordinator data.
+            value_fns: Functions extracting each metric's value, keyed by metric.
+        """
+        self._path.mkdir(parents=True, exist_ok=True)
+        for key, value_fn in value_fns.items():
+            try:
+                value = float(value_fn(data))
+            except (AttributeError, KeyError, TypeError, ValueError):
+                continue
+            try:
+                self._write(key, day, value)
+            except (OSError, ValueError) as err:
+                _LOGGER.warning("Could not record %s history: %s", key, err)
+
+    def read(
+        self, key: str, start: date | None = None, end: date | None = None
+    ) -> list[tuple[date, float]]:
+        """Return the recorded (day, value) pairs for a metric, oldest first.
+
+        Args:
+            key: The sensor key of the metric.
+            start: The first day to include. Defaults to the first day stored.
+            end: The last day to include. Defaults to the last day stored.
+        """
+        path = self._column_path(key)
+        try:
+            with path.open("rb") as file:
+                size = os.fstat(file.fileno()).st_size
+                if size <= _HEADER.size:
+                    return []
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    first = _read_first_day(mapped)
+                    count = (size - _HEADER.size) // _ITEM
+                    lo = 0 if start is None else max(start.toordinal() - first, 0)
+                    hi = count
+                    if end is not None:
+                        hi = min(end.toordinal() - first + 1, count)
+                    if lo >= hi:
+                        return []
+                    offset = _HEADER.size + lo * _ITEM
+                    with memoryview(mapped) as view, view[
+                        offset : offset + (hi - lo) * _ITEM
+                    ] as raw:
+                        if _SWAP:
+                            column: Any = array("d", raw.tobytes())
+                            column.byteswap()
+                        else:
+                            column = raw.cast("d")
+                        try:
+                            return [
+                                (date.fromordinal(first + lo + index), value)
+                                for index, value in enumerate(column)
+                                if not math.isnan(value)
+                            ]
+                        finally:
+                            if not _SWAP:
+                                column.release()
+        except FileNotFoundError:
+            return []
+
+    def remove(self) -> None:
+        """Delete all stored history."""
+        shutil.rmtree(self._path, ignore_errors=True)
+
+    def _column_path(self, key: str) -> Path:
+        return self._path / f"{key}.col"
+
+    def _write(self, key: str, day: date, value: float) -> None:
+        path = self._column_path(key)
+        ordinal = day.toordinal()
+
+        if not path.exists():
+            _write_column(path, ordinal, _encode([value]))
+            return
+
+        with path.open("r+b") as file:
+            first = _read_first_day(file.read(_HEADER.size))
+            if ordinal < first:
+                # Backfill before the first stored day: rebuild with a new base
+                values = [value] + [_MISSING] * (first - ordinal - 1)
+                _write_column(path, ordinal, _encode(values) + file.read())
+                return
+
+            count = (os.fstat(file.fileno()).st_size - _HEADER.size) // _ITEM
+            index = ordinal - first
+            if index > count:
+                file.seek(_HEADER.size + count * _ITEM)
+                file.write(_encode([_MISSING] * (index - count)))
+            file.seek(_HEADER.size + index * _ITEM)
+            file.write(_encode([value]))
+
+
+def _encode(values: list[float]) -> bytes:
+    column = array("d", values)
+    if _SWAP:
+        column.byteswap()
+    return column.tobytes()
+
+
+def _read_first_day(header: bytes | mmap.mmap) -> int:
+    if len(header) < _HEADER.size:
+        raise ValueError("Truncated Ultrahuman history column")
+    magic, first = _HEADER.unpack_from(header)
+    if magic != _MAGIC:
+        raise ValueError("Not an Ultrahuman history column")
+    return first
+
+
+def _write_column(path: Path, first: int, data: bytes) -> None:
+    tmp = path.with_suffix(".tmp")
+    with tmp.open("wb") as file:
+        file.write(_HEADER.pack(_MAGIC, first))
+        file.write(data)
+    os.replace(tmp, path)
+    _LOGGER.debug(
+        "Wrote history column %s starting %s", path.name, date.fromordinal(first)
+    )
@@ -343,6 +343,13 @@ async def async_setup_entry(
     """Set up Ultrahuman sensors from a config entry."""
     coordinator: UltrahumanDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
+    await coordinator.async_set_history_fields(
+        {
+            description.key: description.value_fn
+            for description in SENSOR_DESCRIPTIONS
+        }
+    )
+
     async_add_entities(
         UltrahumanSensor(coordinator, description, entry)
         for description in SENSOR_DESCRIPTIONS
@@ -387,3 +394,20 @@ class UltrahumanSensor(
         if self.coordinator.data is None:
             return None
         return self.entity_description.value_fn(self.coordinator.data)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the stale flag, plus the data's fetch time while stale.
+
+        The fetch time is only included while stale so that unchanged values
+        do not produce a new state on every successful refresh.
+        """
+        if not self.coordinator.is_stale:
+            return {"stale": False}
+        last_success = self.coordinator.last_success_time
+        return {
+            "stale": True,
+            "last_successful_update": (
+                last_success.isoformat() if last_success is not None else None
+            ),
+        }